@@ -3,161 +3,510 @@ import numpy as np
 from pathlib import Path
 import folium
 from folium import plugins
-import requests
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import requests_cache
+from requests.adapters import HTTPAdapter
 import json
+import re
 import time
+import sqlite3
+import threading
+import functools
+from datetime import timedelta
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 from collections import Counter
-import colorsys
 
 
-def load_police_data():
-    """Load the Dallas police incidents data."""
-    data_path = (
-        Path(__file__).parent.parent.parent
-        / "data"
-        / "external"
-        / "Public_Safety_-_Police_Incidents_20250729.csv"
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_HEADERS = {"User-Agent": "Dallas-Police-Incidents-Mapping/1.0"}
+GEOCODE_WORKERS = 4
+
+DEFAULT_MARKER_COLOR = "#808080"
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data" / "external"
+GEOCODE_CACHE_PATH = DATA_DIR / "geocode_cache.db"
+LEGACY_CACHE_PATH = DATA_DIR / "dallas_zip_coordinates.json"
+HTTP_CACHE_PATH = DATA_DIR / "nominatim_cache"
+
+POLICE_CSV_PATH = DATA_DIR / "Public_Safety_-_Police_Incidents_20250729.csv"
+POLICE_PARQUET_PATH = DATA_DIR / "Public_Safety_-_Police_Incidents_20250729.parquet"
+
+MAP_YEAR = 2024
+
+# Keywords for burglary and property-related crimes (excluding TRESPASS, FRAUD, FORGERY)
+PROPERTY_KEYWORDS = [
+    "BURGLARY",
+    "THEFT",
+    "ROBBERY",
+    "STOLEN",
+    "BREAKING",
+    "ENTERING",
+    "LARCENY",
+    "EMBEZZLEMENT",
+    "AUTO THEFT",
+    "CRIMINAL MISCHIEF",
+    "VANDALISM",
+    "SHOPLIFTING",
+]
+PROPERTY_PATTERN = re.compile("|".join(re.escape(k) for k in PROPERTY_KEYWORDS))
+
+# Only the columns the map uses are read. Categorical incident types let
+# groupby work on integer codes; nullable ints keep missing zip codes
+# without falling back to float64.
+POLICE_DATA_COLUMNS = ["count", "Year of Incident", "Type of Incident", "Zip Code"]
+POLICE_DATA_DTYPES = {
+    "Year of Incident": "UInt16",
+    "Type of Incident": "category",
+    "Zip Code": "UInt32",
+}
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls at least `min_interval` seconds apart.
+    Shared by all geocoding workers so the global request rate stays within
+    Nominatim's usage policy (max 1 request per second).
+    """
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self):
+        """Block until the caller is allowed to make the next request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+            self._next_time = now + self.min_interval
+
+
+limiter = RateLimiter(min_interval=1.0)
+
+# Shared geocoding session, created on first use by get_session()
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared HTTP session for Nominatim, creating it on first use.
+    One session keeps connections alive between requests, and responses are
+    cached on disk so repeated queries skip the network entirely.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests_cache.CachedSession(
+                str(HTTP_CACHE_PATH),
+                backend="sqlite",
+                expire_after=timedelta(days=180),
+                allowable_codes=(200, 404),
+            )
+            session.headers.update(NOMINATIM_HEADERS)
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=GEOCODE_WORKERS, pool_maxsize=GEOCODE_WORKERS
+                ),
+            )
+            _session = session
+
+    return _session
+
+
+def convert_police_data_to_parquet(
+    csv_path=POLICE_CSV_PATH, parquet_path=POLICE_PARQUET_PATH
+):
+    """
+    Convert the police incidents CSV to a typed Parquet file.
+    The conversion only runs when the Parquet copy is missing or older than the CSV.
+    """
+    if parquet_path.exists() and (
+        not csv_path.exists()
+        or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        return parquet_path
+
+    print(f"Converting {csv_path.name} to Parquet (one-time)...")
+    df = pd.read_csv(
+        csv_path,
+        usecols=POLICE_DATA_COLUMNS,
+        dtype=POLICE_DATA_DTYPES,
+        engine="pyarrow",
     )
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        parquet_path,
+        compression="zstd",
+    )
+    print(f"Saved {len(df)} records to {parquet_path}")
+    return parquet_path
+
 
+def load_police_data(year=MAP_YEAR):
+    """
+    Load the Dallas police incidents data for property crimes in `year`.
+    The year and incident type filters are pushed down to the Parquet scan
+    so non-matching rows are never materialized.
+    """
     try:
-        df = pd.read_csv(data_path)
-        print(f"Successfully loaded {len(df)} police incident records")
+        dataset = ds.dataset(convert_police_data_to_parquet(), format="parquet")
+
+        # Resolve matching incident types from the distinct values only
+        incident_types = (
+            dataset.to_table(columns=["Type of Incident"])
+            .column("Type of Incident")
+            .unique()
+            .to_pylist()
+        )
+        matching_types = match_property_incident_types(incident_types)
+
+        table = dataset.to_table(
+            columns=POLICE_DATA_COLUMNS,
+            filter=(ds.field("Year of Incident") == year)
+            & ds.field("Type of Incident").isin(
+                pa.array(matching_types, type=pa.string())
+            ),
+        )
+        df = table.to_pandas()
+        print(
+            f"Successfully loaded {len(df)} property crime records from {year} "
+            f"(out of {dataset.count_rows()} police incident records)"
+        )
         return df
     except FileNotFoundError:
-        print(f"Error: Could not find file at {data_path}")
+        print(f"Error: Could not find file at {POLICE_CSV_PATH}")
         return None
     except Exception as e:
         print(f"Error loading data: {e}")
         return None
 
 
-def geocode_zip_code(zip_code, delay=0.1):
+# In-memory copy of the SQLite geocode cache, keyed by query string.
+# Values are (lat, lon) tuples, or None for queries known to have no result.
+# New results are written back to the database the cache was loaded from.
+_geocode_cache = None
+_geocode_cache_path = GEOCODE_CACHE_PATH
+_geocode_cache_lock = threading.Lock()
+
+
+def build_geocode_params(zip_code):
+    """Build the structured Nominatim query parameters for a zip code."""
+    return {
+        "postalcode": zip_code,
+        "state": "Texas",
+        "country": "us",
+        "format": "json",
+        "limit": 1,
+    }
+
+
+def geocode_query_key(zip_code):
+    """Return the query string used as the geocode cache key for a zip code."""
+    return urlencode(build_geocode_params(zip_code))
+
+
+def _connect_geocode_cache(cache_path=GEOCODE_CACHE_PATH):
+    """Open the SQLite geocode cache, creating the table if needed."""
+    conn = sqlite3.connect(cache_path)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS geocode_cache (
+            query TEXT PRIMARY KEY,
+            lat REAL,
+            lon REAL,
+            status TEXT,
+            ts INTEGER
+        )
+        """
+    )
+    return conn
+
+
+def import_legacy_coordinates_cache(conn, legacy_path=LEGACY_CACHE_PATH):
+    """Seed an empty SQLite cache from the old zip-keyed JSON cache."""
+    try:
+        with open(legacy_path, "r") as f:
+            coordinates = json.load(f)
+    except FileNotFoundError:
+        return 0
+
+    now = int(time.time())
+    rows = [
+        (geocode_query_key(int(zip_code)), lat, lon, "found", now)
+        for zip_code, (lat, lon) in coordinates.items()
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO geocode_cache VALUES (?, ?, ?, ?, ?)", rows
+        )
+
+    print(f"Imported {len(rows)} zip code coordinates from {legacy_path}")
+    return len(rows)
+
+
+def load_coordinates_cache(cache_path=GEOCODE_CACHE_PATH):
     """
-    Geocode a zip code using Nominatim API.
-    Returns (lat, lon) tuple or None if not found.
+    Load every cached geocode result from SQLite into memory.
+    Returns a dict mapping query string to (lat, lon), or None for known misses.
     """
+    global _geocode_cache, _geocode_cache_path
+
     try:
-        # Add delay to respect API rate limits
-        time.sleep(delay)
-
-        url = f"https://nominatim.openstreetmap.org/search"
-        params = {
-            "q": f"{zip_code}, Dallas, Texas, USA",
-            "format": "json",
-            "limit": 1,
-            "countrycodes": "us",
-        }
-        headers = {"User-Agent": "Dallas-Police-Incidents-Mapping/1.0"}
+        conn = _connect_geocode_cache(cache_path)
+        try:
+            (n_rows,) = conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()
+            if n_rows == 0:
+                import_legacy_coordinates_cache(conn)
+
+            rows = conn.execute(
+                "SELECT query, lat, lon, status FROM geocode_cache"
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Error loading geocode cache: {e}")
+        rows = []
+
+    cache = {
+        query: (lat, lon) if status == "found" else None
+        for query, lat, lon, status in rows
+    }
+
+    with _geocode_cache_lock:
+        _geocode_cache = cache
+        _geocode_cache_path = cache_path
+
+    n_misses = sum(coords is None for coords in cache.values())
+    print(
+        f"Loaded {len(cache)} cached geocode results from {cache_path} "
+        f"({n_misses} known misses)"
+    )
+    return cache
 
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()
 
-        data = response.json()
-        if data:
-            lat = float(data[0]["lat"])
-            lon = float(data[0]["lon"])
-            return (lat, lon)
-        else:
-            print(f"No coordinates found for zip code {zip_code}")
+def save_geocode_result(query, coords):
+    """
+    Persist one geocode result to the loaded cache, storing misses so they
+    are not retried.
+    """
+    status = "found" if coords else "notfound"
+    lat, lon = coords if coords else (None, None)
+
+    with _geocode_cache_lock:
+        _geocode_cache[query] = coords
+
+        try:
+            conn = _connect_geocode_cache(_geocode_cache_path)
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO geocode_cache VALUES (?, ?, ?, ?, ?)",
+                        (query, lat, lon, status, int(time.time())),
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Error saving geocode result for {query}: {e}")
+
+
+def is_geocode_cached(zip_code):
+    """Return True if a zip code already has a cached hit or miss."""
+    if _geocode_cache is None:
+        load_coordinates_cache()
+    return geocode_query_key(zip_code) in _geocode_cache
+
+
+def cache_geocode_results(func):
+    """
+    Serve geocode lookups from the SQLite cache, calling `func` only on a miss.
+    Successful lookups and empty results are both persisted; request errors
+    are not, so they will be retried on the next run.
+    """
+
+    @functools.wraps(func)
+    def wrapper(zip_code):
+        if is_geocode_cached(zip_code):
+            return _geocode_cache[geocode_query_key(zip_code)]
+
+        try:
+            coords = func(zip_code)
+        except Exception as e:
+            print(f"Error geocoding zip code {zip_code}: {e}")
             return None
 
-    except Exception as e:
-        print(f"Error geocoding zip code {zip_code}: {e}")
+        save_geocode_result(geocode_query_key(zip_code), coords)
+        return coords
+
+    return wrapper
+
+
+@cache_geocode_results
+def geocode_zip_code(zip_code):
+    """
+    Geocode a zip code using Nominatim API.
+    Returns (lat, lon) tuple or None if not found.
+    """
+    # Structured query is more precise than free-form text for postcodes
+    params = build_geocode_params(zip_code)
+
+    # Cached responses are served without touching the network, so only
+    # uncached queries wait for the shared rate limiter
+    session = get_session()
+    response = session.get(NOMINATIM_URL, params=params, only_if_cached=True)
+    if response.status_code == 504:
+        limiter.acquire()
+        response = session.get(NOMINATIM_URL, params=params)
+    response.raise_for_status()
+
+    data = response.json()
+    if data:
+        lat = float(data[0]["lat"])
+        lon = float(data[0]["lon"])
+        return (lat, lon)
+    else:
+        print(f"No coordinates found for zip code {zip_code}")
         return None
 
 
-def create_zip_coordinates_cache(df):
+def get_unique_zip_codes(df):
+    """Return the unique non-null zip codes in the data as ints."""
+    return df["Zip Code"].dropna().astype(int).unique().tolist()
+
+
+def create_zip_coordinates_cache(df, geocode_new=True):
     """
     Create a cache of zip code coordinates.
-    This will take some time due to API rate limiting.
+    Cached zip codes are served from disk; only new ones hit the API.
+    With geocode_new=False, zip codes missing from the cache are skipped.
     """
     print("Creating zip code coordinates cache...")
 
-    # Get unique zip codes (excluding NaN)
-    unique_zips = df[df["Zip Code"].notna()]["Zip Code"].unique()
+    zips = get_unique_zip_codes(df)
+    if not geocode_new:
+        zips = [z for z in zips if is_geocode_cached(z)]
 
     coordinates = {}
-    total_zips = len(unique_zips)
+    total_zips = len(zips)
 
     print(f"Geocoding {total_zips} unique zip codes (this may take several minutes)...")
 
-    for i, zip_code in enumerate(unique_zips, 1):
-        print(f"Geocoding {i}/{total_zips}: {int(zip_code)}")
+    # Workers overlap network latency; the shared limiter caps the request rate
+    with ThreadPoolExecutor(max_workers=GEOCODE_WORKERS) as executor:
+        results = executor.map(geocode_zip_code, zips)
 
-        coords = geocode_zip_code(int(zip_code))
-        if coords:
-            coordinates[int(zip_code)] = coords
+        for i, (zip_code, coords) in enumerate(zip(zips, results), 1):
+            print(f"Geocoded {i}/{total_zips}: {zip_code}")
 
-        # Progress update every 10 zip codes
-        if i % 10 == 0:
-            print(f"Progress: {i}/{total_zips} completed")
+            if coords:
+                coordinates[zip_code] = coords
+
+            # Progress update every 10 zip codes
+            if i % 10 == 0:
+                print(f"Progress: {i}/{total_zips} completed")
 
     print(f"Successfully geocoded {len(coordinates)}/{total_zips} zip codes")
     return coordinates
 
 
+def hsv_to_rgb(hue, saturation, value):
+    """
+    Vectorized equivalent of colorsys.hsv_to_rgb.
+    Takes equal-length arrays of HSV components in [0, 1], returns an (n, 3) array.
+    """
+    hue, saturation, value = (
+        np.asarray(c, dtype=float) for c in (hue, saturation, value)
+    )
+
+    sector = (hue * 6.0).astype(int)
+    f = hue * 6.0 - sector
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    sector = sector % 6
+
+    # (6 sectors, 3 channels, n colors); pick each color's sector
+    candidates = np.stack(
+        [
+            [value, t, p],
+            [q, value, p],
+            [p, value, t],
+            [p, q, value],
+            [t, p, value],
+            [value, p, q],
+        ]
+    )
+    return candidates[sector, :, np.arange(len(hue))]
+
+
 def generate_colors_for_incident_types(incident_types, max_colors=50):
     """
     Generate distinct colors for incident types.
     Uses HSV color space to create visually distinct colors.
     """
-    colors = {}
     n_types = min(len(incident_types), max_colors)
+    idx = np.arange(n_types)
 
     # Generate colors using golden ratio for better distribution
     golden_ratio = 0.618033988749895
+    hue = (idx * golden_ratio) % 1.0
+    # Use high saturation and medium-high value for vibrant colors
+    saturation = 0.7 + (idx % 3) * 0.1  # 0.7, 0.8, 0.9
+    value = 0.8 + (idx % 2) * 0.1  # 0.8, 0.9
 
-    for i, incident_type in enumerate(incident_types[:max_colors]):
-        hue = (i * golden_ratio) % 1.0
-        # Use high saturation and medium-high value for vibrant colors
-        saturation = 0.7 + (i % 3) * 0.1  # 0.7, 0.8, 0.9
-        value = 0.8 + (i % 2) * 0.1  # 0.8, 0.9
-
-        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-        hex_color = "#%02x%02x%02x" % tuple(int(c * 255) for c in rgb)
-        colors[incident_type] = hex_color
+    rgb = (hsv_to_rgb(hue, saturation, value) * 255).astype(int)
+    hex_colors = ["#%02x%02x%02x" % tuple(channels) for channels in rgb.tolist()]
+    colors = dict(zip(incident_types[:max_colors], hex_colors))
 
     # Use gray for any remaining incident types
     for incident_type in incident_types[max_colors:]:
-        colors[incident_type] = "#808080"
+        colors[incident_type] = DEFAULT_MARKER_COLOR
 
     return colors
 
 
+def match_property_incident_types(incident_types):
+    """Return the incident types that contain any property crime keyword."""
+    return [
+        incident_type
+        for incident_type in incident_types
+        if incident_type is not None
+        and PROPERTY_PATTERN.search(str(incident_type).upper())
+    ]
+
+
 def filter_for_burglary_property_incidents(df):
     """
     Filter data for burglary and property-related incidents only.
     Groups all into a single 'Property Crime' category.
     """
-    # Define keywords for burglary and property-related crimes (excluding TRESPASS, FRAUD, FORGERY)
-    property_keywords = [
-        "BURGLARY",
-        "THEFT",
-        "ROBBERY",
-        "STOLEN",
-        "BREAKING",
-        "ENTERING",
-        "LARCENY",
-        "EMBEZZLEMENT",
-        "AUTO THEFT",
-        "CRIMINAL MISCHIEF",
-        "VANDALISM",
-        "SHOPLIFTING",
-    ]
-
-    # Create filter mask
-    incident_type_col = df["Type of Incident"].astype(str).str.upper()
-    mask = incident_type_col.str.contains(
-        "|".join(property_keywords), na=False, regex=True
-    )
+    # Match keywords against each unique incident type once, then build the
+    # row mask by category membership instead of scanning every row's string
+    incident_types = df["Type of Incident"].astype("category")
+    matching_types = match_property_incident_types(incident_types.cat.categories)
+    mask = incident_types.isin(matching_types)
 
     filtered_df = df[mask].copy()
 
     # Store original incident types for the description
-    filtered_df["Original_Incident_Type"] = filtered_df["Type of Incident"].copy()
+    filtered_df["Original_Incident_Type"] = (
+        filtered_df["Type of Incident"]
+        .astype("category")
+        .cat.remove_unused_categories()
+    )
 
     # Group all property crimes into single category
-    filtered_df["Type of Incident"] = "Property Crime"
+    filtered_df["Type of Incident"] = pd.Categorical(
+        ["Property Crime"] * len(filtered_df)
+    )
 
     print(
         f"Filtered to {len(filtered_df)} property/burglary related incidents from {len(df)} total records"
@@ -174,53 +523,113 @@ def prepare_map_data(df, zip_coordinates):
     print("Preparing map data...")
 
     # Filter for 2024 data only
-    df_2024 = df[df["Year of Incident"] == 2024].copy()
-    print(f"Filtered to {len(df_2024)} records from 2024")
+    df_2024 = df[df["Year of Incident"] == MAP_YEAR].copy()
+    print(f"Filtered to {len(df_2024)} records from {MAP_YEAR}")
 
     # Filter for burglary and property-related incidents
     df_filtered = filter_for_burglary_property_incidents(df_2024)
 
-    # Filter data with valid zip codes and coordinates
-    df_clean = df_filtered[df_filtered["Zip Code"].notna()].copy()
-    df_clean = df_clean[df_clean["Zip Code"].isin(zip_coordinates.keys())]
+    # Filter data with valid zip codes and coordinates, comparing integer
+    # arrays directly (missing zip codes become -1, which never matches)
+    valid_zips = np.fromiter(
+        zip_coordinates.keys(), dtype=np.int32, count=len(zip_coordinates)
+    )
+    zip_values = df_filtered["Zip Code"].to_numpy(dtype=np.int32, na_value=-1)
+    df_clean = df_filtered[np.isin(zip_values, valid_zips)].copy()
 
     print(f"After filtering: {len(df_clean)} records with valid zip codes")
 
-    count_column = df_clean.columns[0]  # 'count' column
-
-    # Group by zip code and collect incident details with counts
-    incident_details = (
-        df_clean.groupby(["Zip Code", "Original_Incident_Type"])[count_column]
+    # Aggregate once at the finest level; everything else is derived from it
+    agg = (
+        df_clean.groupby(
+            ["Zip Code", "Type of Incident", "Original_Incident_Type"], observed=True
+        )["count"]
         .sum()
         .reset_index()
     )
-    incident_counts = (
-        incident_details.groupby("Zip Code")
-        .apply(lambda x: dict(zip(x["Original_Incident_Type"], x[count_column])))
-        .to_dict()
+
+    # Build each zip's popup incident list (sorted by frequency) in one pass
+    inc_long = agg.sort_values(
+        ["Zip Code", "count"], ascending=[True, False], kind="stable"
+    )
+    inc_long["line"] = (
+        "• "
+        + inc_long["Original_Incident_Type"].astype(str)
+        + ": "
+        + inc_long["count"].map("{:,}".format).astype(str)
+    )
+    incident_lists = (
+        inc_long.groupby("Zip Code", observed=True)["line"].agg("<br>".join).to_dict()
     )
 
     # Group by zip code for main data
     grouped = (
-        df_clean.groupby(["Zip Code", "Type of Incident"])[count_column]
+        agg.groupby(["Zip Code", "Type of Incident"], observed=True)["count"]
         .sum()
         .reset_index()
     )
 
-    # Add incident counts details
-    grouped["Incident_Counts"] = grouped["Zip Code"].map(incident_counts)
+    # Add incident details for the popups
+    grouped["Incident_List"] = grouped["Zip Code"].map(incident_lists)
 
-    # Add coordinates
-    grouped["lat"] = grouped["Zip Code"].map(lambda x: zip_coordinates[x][0])
-    grouped["lon"] = grouped["Zip Code"].map(lambda x: zip_coordinates[x][1])
+    # Add coordinates with a single join instead of per-row lookups
+    coords_df = (
+        pd.DataFrame.from_dict(zip_coordinates, orient="index", columns=["lat", "lon"])
+        .rename_axis("Zip Code")
+        .reset_index()
+    )
+    grouped = grouped.merge(coords_df, on="Zip Code", how="left")
 
     print(f"Prepared {len(grouped)} zip code/incident type combinations for mapping")
     return grouped
 
 
-def create_incident_map(map_data, zip_coordinates):
+def scale_marker_sizes(counts, min_size=5, max_size=30, equal_size=15):
+    """
+    Scale incident counts linearly to marker radii between min_size and max_size.
+    Returns equal_size for every marker if all counts are equal.
+    """
+    counts = np.asarray(counts, dtype=float)
+    if len(counts) == 0:
+        return counts
+
+    min_count = counts.min()
+    max_count = counts.max()
+    if max_count == min_count:
+        return np.full(len(counts), float(equal_size))
+
+    normalized = (counts - min_count) / (max_count - min_count)
+    return min_size + normalized * (max_size - min_size)
+
+
+def marker_geojson_filename(index, layer_key):
+    """
+    Return the sidecar file name for a marker layer, named after its type.
+    The layer's position keeps names unique when two types slug the same;
+    the ungrouped layer gets a name no indexed layer can produce.
+    """
+    if layer_key is None:
+        return "markers_other.geojson"
+    slug = re.sub(r"[^a-z0-9]+", "_", str(layer_key).lower()).strip("_")
+    return f"markers_{index}_{slug}.geojson" if slug else f"markers_{index}.geojson"
+
+
+def write_marker_geojson(features, path):
+    """Write a FeatureCollection of marker features to a GeoJSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"type": "FeatureCollection", "features": features},
+            f,
+            ensure_ascii=False,
+        )
+
+
+def create_incident_map(map_data, zip_coordinates, marker_data_dir=None):
     """
     Create the interactive Folium map.
+    If marker_data_dir is given, marker data is written there as GeoJSON sidecar
+    files that the page loads at runtime instead of embedding it in the HTML.
+    The HTML must then be saved to the same directory.
     """
     print("Creating interactive map...")
 
@@ -239,76 +648,118 @@ def create_incident_map(map_data, zip_coordinates):
     colors = generate_colors_for_incident_types(incident_types)
 
     # Calculate marker sizes based on incident counts
-    count_column = map_data.columns[2]  # count column
-    min_count = map_data[count_column].min()
-    max_count = map_data[count_column].max()
-
-    # Scale marker sizes between 5 and 30 pixels
-    def scale_marker_size(count):
-        if max_count == min_count:
-            return 15
-        normalized = (count - min_count) / (max_count - min_count)
-        return 5 + normalized * 25
+    sizes = scale_marker_sizes(map_data["count"].to_numpy())
 
     # Create feature groups for each incident type (for layer control)
     feature_groups = {}
     # Limit to top 10 incident types for better performance
     top_incident_types = (
-        map_data.groupby("Type of Incident")[count_column].sum().nlargest(10).index
+        map_data.groupby("Type of Incident", observed=True)["count"]
+        .sum()
+        .nlargest(10)
+        .index
     )
     for incident_type in top_incident_types:
         feature_groups[incident_type] = folium.FeatureGroup(
             name=incident_type[:50]
         )  # Truncate long names
 
-    # Add markers for each incident type/zip combination
-    for _, row in map_data.iterrows():
-        incident_type = row["Type of Incident"]
-        zip_code = int(row["Zip Code"])
-        count = row[count_column]
-        lat, lon = row["lat"], row["lon"]
-
-        color = colors.get(incident_type, "#808080")
-        size = scale_marker_size(count)
-
-        # Get incident counts for this location
-        incident_counts_dict = row["Incident_Counts"]
-
-        # Sort incidents by count (descending order)
-        sorted_incidents = sorted(
-            incident_counts_dict.items(), key=lambda x: x[1], reverse=True
+    # Look up each incident type's color once, then index by categorical code;
+    # the trailing default color is what code -1 (missing type) resolves to
+    type_categories = map_data["Type of Incident"].astype("category")
+    type_colors = np.array(
+        [
+            colors.get(incident_type, DEFAULT_MARKER_COLOR)
+            for incident_type in type_categories.cat.categories
+        ]
+        + [DEFAULT_MARKER_COLOR]
+    )
+    marker_colors = type_colors[type_categories.cat.codes.to_numpy()]
+
+    # Rename to valid identifiers so rows can be read as namedtuple attributes,
+    # and cast integer columns once rather than per row
+    marker_data = (
+        map_data.rename(
+            columns={
+                "Zip Code": "Zip_Code",
+                "Type of Incident": "Incident",
+                "count": "Count",
+            }
         )
+        .astype({"Zip_Code": int, "Count": int})
+        .assign(Size=sizes, Color=marker_colors)
+    )
 
-        # Create formatted list with counts
-        incident_list = "<br>".join(
-            [f"• {incident}: {count:,}" for incident, count in sorted_incidents]
-        )
+    # Collect one GeoJSON feature per incident type/zip combination, grouped
+    # by the layer it belongs to (None for types without a feature group)
+    features_by_layer = {}
+    for row in marker_data.itertuples(index=False):
+        incident_type = row.Incident
+        zip_code = row.Zip_Code
+        count = row.Count
 
-        # Create popup text
+        # Create popup text from the precomputed incident list
         popup_text = f"""
         <b>Zip Code:</b> {zip_code}<br>
         <b>Total Property Crimes:</b> {count:,}<br>
         <br><b>Incident Types (by frequency):</b><br>
-        {incident_list}
+        {row.Incident_List}
         """
 
-        # Create marker
-        marker = folium.CircleMarker(
-            location=[lat, lon],
-            radius=size,
-            popup=folium.Popup(popup_text, max_width=300),
-            color="black",
-            weight=1,
-            fillColor=color,
-            fillOpacity=0.7,
-            tooltip=f"Property Crimes: {count:,} incidents",
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [row.lon, row.lat]},
+            "properties": {
+                "style": {
+                    "radius": float(row.Size),
+                    "fillColor": row.Color,
+                },
+                "popup": popup_text,
+                "tooltip": f"Property Crimes: {count:,} incidents",
+            },
+        }
+        layer_key = incident_type if incident_type in feature_groups else None
+        features_by_layer.setdefault(layer_key, []).append(feature)
+
+    # Render each layer as a single GeoJSON object instead of one Leaflet
+    # object per marker; popups and tooltips are bound client-side
+    bind_popup_and_tooltip = folium.JsCode(
+        """
+        function(feature, layer) {
+            layer.bindPopup(feature.properties.popup, {maxWidth: 300});
+            layer.bindTooltip(feature.properties.tooltip);
+        }
+        """
+    )
+    # Remove sidecars from earlier runs so no stale layer files are left behind
+    if marker_data_dir is not None:
+        for stale_path in Path(marker_data_dir).glob("markers_*.geojson"):
+            stale_path.unlink()
+
+    for index, (layer_key, features) in enumerate(features_by_layer.items()):
+        geojson = folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            marker=folium.CircleMarker(
+                color="black", weight=1, fill=True, fill_opacity=0.7
+            ),
+            on_each_feature=bind_popup_and_tooltip,
         )
 
+        # Load the layer from a sidecar file (relative to the HTML) rather
+        # than rendering its features into the page
+        if marker_data_dir is not None:
+            marker_data_path = Path(marker_data_dir) / marker_geojson_filename(
+                index, layer_key
+            )
+            write_marker_geojson(features, marker_data_path)
+            geojson.embed = False
+            geojson.embed_link = marker_data_path.name
+
         # Add to appropriate feature group (if it exists)
-        if incident_type in feature_groups:
-            marker.add_to(feature_groups[incident_type])
+        if layer_key is not None:
+            geojson.add_to(feature_groups[layer_key])
         else:
-            marker.add_to(m)
+            geojson.add_to(m)
 
     # Add feature groups to map
     for fg in feature_groups.values():
@@ -335,67 +786,43 @@ def create_incident_map(map_data, zip_coordinates):
     return m
 
 
-def save_coordinates_cache(coordinates, filename="dallas_zip_coordinates.json"):
-    """Save zip code coordinates to a JSON file for future use."""
-    cache_path = Path(__file__).parent.parent.parent / "data" / "external" / filename
-
-    with open(cache_path, "w") as f:
-        json.dump(coordinates, f, indent=2)
-
-    print(f"Saved coordinates cache to {cache_path}")
-
-
-def load_coordinates_cache(filename="dallas_zip_coordinates.json"):
-    """Load zip code coordinates from a JSON file."""
-    cache_path = Path(__file__).parent.parent.parent / "data" / "external" / filename
-
-    try:
-        with open(cache_path, "r") as f:
-            coordinates = json.load(f)
-
-        # Convert string keys back to integers
-        coordinates = {int(k): v for k, v in coordinates.items()}
-        print(f"Loaded {len(coordinates)} zip code coordinates from cache")
-        return coordinates
-    except FileNotFoundError:
-        print("No coordinates cache found, will need to geocode zip codes")
-        return None
-    except Exception as e:
-        print(f"Error loading coordinates cache: {e}")
-        return None
-
-
 def main():
     """Main function to create the Dallas police incidents map."""
     print("Dallas Police Incidents Interactive Map Generator")
     print("=" * 50)
 
-    # Load police data
-    df = load_police_data()
+    # Load police data and every cached geocode result (hits and known
+    # misses) concurrently, since the two reads are independent
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        df_future = executor.submit(load_police_data)
+        cache_future = executor.submit(load_coordinates_cache)
+        df = df_future.result()
+        cache_future.result()
+
     if df is None:
         return
 
-    # Try to load existing coordinates cache
-    zip_coordinates = load_coordinates_cache()
+    zips = get_unique_zip_codes(df)
+    uncached_zips = [z for z in zips if not is_geocode_cached(z)]
+    geocode_new = True
 
-    if zip_coordinates is None:
-        # Create new coordinates cache (this will take time)
+    if uncached_zips:
+        # Geocode new zip codes (this will take time)
         print(
-            "\nWARNING: Geocoding zip codes will take several minutes due to API rate limits."
+            f"\nWARNING: Geocoding {len(uncached_zips)} new zip codes will take "
+            "several minutes due to API rate limits."
         )
         response = input("Continue? (y/n): ")
 
         if response.lower() != "y":
-            print("Operation cancelled.")
-            return
+            print("Skipping new zip codes; mapping cached zip codes only.")
+            geocode_new = False
 
-        zip_coordinates = create_zip_coordinates_cache(df)
+    zip_coordinates = create_zip_coordinates_cache(df, geocode_new=geocode_new)
 
-        if zip_coordinates:
-            save_coordinates_cache(zip_coordinates)
-        else:
-            print("Failed to create coordinates cache")
-            return
+    if zips and not zip_coordinates:
+        print("Failed to create coordinates cache")
+        return
 
     # Prepare map data
     map_data = prepare_map_data(df, zip_coordinates)
@@ -404,10 +831,6 @@ def main():
         print("No mappable data available")
         return
 
-    # Create map
-    incident_map = create_incident_map(map_data, zip_coordinates)
-
-    # Save map
     output_path = (
         Path(__file__).parent.parent.parent
         / "reports"
@@ -415,16 +838,25 @@ def main():
     )
     output_path.parent.mkdir(exist_ok=True)
 
+    # Create map, writing marker data as GeoJSON next to the HTML
+    incident_map = create_incident_map(
+        map_data, zip_coordinates, marker_data_dir=output_path.parent
+    )
+
+    # Save map
     incident_map.save(str(output_path))
     print(f"\nInteractive map saved to: {output_path}")
-    print("Open the HTML file in a web browser to view the map.")
+    print(
+        "Serve the reports directory over HTTP (e.g. python -m http.server) "
+        "and open the HTML file in a web browser to view the map."
+    )
 
     # Print summary statistics
     print(f"\nMap Summary:")
     print(f"- Total incident locations: {len(map_data)}")
     print(f"- Unique zip codes: {len(map_data['Zip Code'].unique())}")
     print(f"- Unique incident types: {len(map_data['Type of Incident'].unique())}")
-    print(f"- Total incidents mapped: {map_data[map_data.columns[2]].sum():,}")
+    print(f"- Total incidents mapped: {map_data['count'].sum():,}")
 
 
 if __name__ == "__main__":